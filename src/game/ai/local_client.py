@@ -7,19 +7,26 @@ extended to call an HTTP endpoint without blocking the main thread.
 
 from __future__ import annotations
 
-import json
+import functools
+import http.client
+import itertools
 import random
 import threading
-import urllib.request
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Optional
 
 import pygame
 
 from game.config import PROJECT_ROOT
+from game.jsonutil import dumps, load_path_cached, loads
 
+_SANITIZE_TABLE = str.maketrans({"\r": " "})
 
-@dataclass
+
+@dataclass(slots=True)
 class AIRequest:
     """Container describing an AI generation request."""
 
@@ -31,7 +38,7 @@ class AIRequest:
     max_tokens: int = 120
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalAISettings:
     enabled: bool = False
     endpoint: str = ""
@@ -43,8 +50,7 @@ class LocalAISettings:
     def load(cls) -> "LocalAISettings":
         settings_path = PROJECT_ROOT / "data" / "ai" / "settings.json"
         if settings_path.exists():
-            with settings_path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = load_path_cached(settings_path)
             return cls(
                 enabled=bool(data.get("enabled", False)),
                 endpoint=str(data.get("endpoint", "")),
@@ -58,19 +64,25 @@ class LocalAISettings:
 class LocalAIClient:
     """Very small asynchronous dispatcher for AI replies."""
 
-    def __init__(self) -> None:
-        self.pending: List[AIRequest] = []
+    def __init__(self, settings_future: Optional["Future[LocalAISettings]"] = None) -> None:
         self.responses: Dict[int, str] = {}
-        self._counter = 0
-        self._lock = threading.Lock()
-        self.settings = LocalAISettings.load()
+        self._counter = itertools.count()
+        # A caller can kick the settings load off early (overlapping it with
+        # pygame init) and hand us the future; otherwise load synchronously.
+        self.settings = settings_future.result() if settings_future is not None else LocalAISettings.load()
+        self._headers = {"Content-Type": "application/json"}
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai")
+        self._persona_handlers: Dict[str, Callable[[str, Dict[str, str]], str]] = {
+            "mom": self._mom_stub,
+            "friend_zara": functools.partial(self._friend_stub, "Zara"),
+            "friend_lukas": functools.partial(self._friend_stub, "Lukas"),
+        }
 
     def submit(self, request: AIRequest, callback: Optional[Callable[[str], None]] = None) -> int:
-        with self._lock:
-            request_id = self._counter
-            self._counter += 1
-        self.pending.append(request)
-        threading.Thread(target=self._run_generation, args=(request_id, request, callback), daemon=True).start()
+        request_id = next(self._counter)
+        self._pool.submit(self._run_generation, request_id, request, callback)
         return request_id
 
     def _run_generation(self, request_id: int, request: AIRequest, callback: Optional[Callable[[str], None]]) -> None:
@@ -81,8 +93,8 @@ class LocalAIClient:
         if not response:
             response = self._generate_stub(request)
         response = self._sanitize(response)
-        with self._lock:
-            self.responses[request_id] = response
+        # CPython dict stores are atomic under the GIL, so no lock is needed.
+        self.responses[request_id] = response
         if callback:
             callback(response)
 
@@ -95,18 +107,63 @@ class LocalAIClient:
             "temperature": request.temperature,
             "max_tokens": request.max_tokens,
         }
+        body = self._post(dumps(payload))
+        if body is None:
+            return None
         try:
-            req = urllib.request.Request(
-                self.settings.endpoint,
-                data=json.dumps(payload).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=self.settings.timeout) as resp:
-                body = resp.read().decode("utf-8")
-            data = json.loads(body)
-            return str(data.get("response") or data.get("text") or "")
-        except Exception:
+            data = loads(body)
+        except ValueError:
             return None
+        return str(data.get("response") or data.get("text") or "")
+
+    def _post(self, body: bytes) -> Optional[bytes]:
+        """POST to the configured endpoint over a persistent connection.
+
+        The connection is kept alive between generations so repeated calls
+        skip the TCP (and TLS) handshake; a stale or refused connection is
+        dropped and retried once before giving up.
+        """
+
+        parts = urllib.parse.urlsplit(self.settings.endpoint)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        with self._conn_lock:
+            for attempt in range(2):
+                try:
+                    if self._conn is None:
+                        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                        self._conn = conn_cls(parts.netloc, timeout=self.settings.timeout)
+                    self._conn.request("POST", path, body=body, headers=self._headers)
+                    resp = self._conn.getresponse()
+                    # Long generations arrive over many packets; accumulate
+                    # fixed-size chunks instead of one monolithic read() so
+                    # the buffer grows amortized rather than in big reallocs.
+                    buffer = bytearray()
+                    while True:
+                        chunk = resp.read(16384)
+                        if not chunk:
+                            break
+                        buffer += chunk
+                    return bytes(buffer)
+                except Exception:
+                    self._drop_connection()
+        return None
+
+    def _drop_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    def close(self) -> None:
+        """Release the worker pool and HTTP connection; call on shutdown."""
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._conn_lock:
+            self._drop_connection()
 
     def poll_response(self, request_id: int) -> Optional[str]:
         return self.responses.get(request_id)
@@ -114,24 +171,20 @@ class LocalAIClient:
     def _generate_stub(self, request: AIRequest) -> str:
         persona = request.persona
         prompt = request.prompt.lower()
-        context_flags = ", ".join(f"{k}:{v}" for k, v in sorted(request.context.items()))
-        if persona == "mom":
-            return self._mom_stub(prompt, context_flags)
-        if persona == "friend_zara":
-            return self._friend_stub("Zara", prompt, context_flags)
-        if persona == "friend_lukas":
-            return self._friend_stub("Lukas", prompt, context_flags)
-        return "I'm not sure what to say right now, but I'm here."
-
-    def _mom_stub(self, prompt: str, context_flags: str) -> str:
-        mood_tag = "" if "mood:high" not in context_flags else " She notices your spark."
-        if "tired" in context_flags:
+        handler = self._persona_handlers.get(persona)
+        if handler is None:
+            return "I'm not sure what to say right now, but I'm here."
+        return handler(prompt, request.context)
+
+    def _mom_stub(self, prompt: str, context: Dict[str, str]) -> str:
+        mood_tag = " She notices your spark." if context.get("mood") == "high" else ""
+        if "tired" in context:
             return "Mom sighs, rubs her temples, and admits she's just exhausted from the day." + mood_tag
-        if "drunk" in context_flags:
+        if "drunk" in context:
             return "Mom leans in with a conspiratorial grin, oversharing a bittersweet memory about her twenties." + mood_tag
         return "Mom offers a small smile and asks how the fries went tonight." + mood_tag
 
-    def _friend_stub(self, name: str, prompt: str, context_flags: str) -> str:
+    def _friend_stub(self, name: str, prompt: str, context: Dict[str, str]) -> str:
         if "homework" in prompt:
             return f"{name}: haha, your homework is basically improv theatre, you'll nail it."
         if "tired" in prompt:
@@ -147,10 +200,36 @@ class LocalAIClient:
         return random.choice(choices)
 
     def _sanitize(self, text: str) -> str:
-        cleaned = text.replace("\r", " ").strip()
-        if len(cleaned) > 240:
-            cleaned = cleaned[:237] + "..."
-        return cleaned
+        cleaned = text.translate(_SANITIZE_TABLE).strip()
+        return cleaned if len(cleaned) <= 240 else cleaned[:237] + "..."
+
+
+_RENDER_CACHE_LIMIT = 128
+_render_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+def _render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """LRU-cached font.render, since stub responses repeat verbatim."""
+
+    key = (id(font), text, color)
+    cached = _render_cache.get(key)
+    if cached is not None:
+        _render_cache.move_to_end(key)
+        return cached
+    rendered = font.render(text, True, color)
+    _render_cache[key] = rendered
+    if len(_render_cache) > _RENDER_CACHE_LIMIT:
+        _render_cache.popitem(last=False)
+    return rendered
+
+
+@functools.lru_cache(maxsize=64)
+def _bubble_template(width: int, height: int) -> pygame.Surface:
+    """Rounded-rect bubble background, cached per size bucket."""
+
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (255, 240, 220, 240), surface.get_rect(), border_radius=6)
+    return surface
 
 
 class DialogueBubble(pygame.sprite.Sprite):
@@ -159,16 +238,18 @@ class DialogueBubble(pygame.sprite.Sprite):
     def __init__(self, text: str, position: pygame.math.Vector2, font: pygame.font.Font) -> None:
         super().__init__()
         padding = 8
-        rendered = font.render(text, True, (32, 24, 20))
-        self.image = pygame.Surface((rendered.get_width() + padding * 2, rendered.get_height() + padding * 2), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (255, 240, 220, 240), self.image.get_rect(), border_radius=6)
+        rendered = _render_text(font, text, (32, 24, 20))
+        # Bucket sizes to the nearest 8px so similar bubbles share a template.
+        width = (rendered.get_width() + padding * 2 + 7) // 8 * 8
+        height = (rendered.get_height() + padding * 2 + 7) // 8 * 8
+        self.image = _bubble_template(width, height).copy()
         self.image.blit(rendered, (padding, padding))
         self.rect = self.image.get_rect()
         self.rect.center = (int(position.x), int(position.y))
 
 
-def serialize_ai_request(request: AIRequest) -> str:
-    return json.dumps(request.__dict__)
+def serialize_ai_request(request: AIRequest) -> bytes:
+    return dumps(asdict(request))
 
 
 __all__ = ["AIRequest", "LocalAIClient", "DialogueBubble", "serialize_ai_request"]
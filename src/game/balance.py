@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 from typing import Any, Dict
 
 from game.config import PROJECT_ROOT
+from game.jsonutil import load_path
 
 _BALANCE_PATH = PROJECT_ROOT / "data" / "balance.json"
 
@@ -19,8 +19,7 @@ class BalanceError(RuntimeError):
 def load_balance() -> Dict[str, Any]:
     if not _BALANCE_PATH.exists():
         raise BalanceError(f"Missing balance configuration at {_BALANCE_PATH}")
-    with _BALANCE_PATH.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    return load_path(_BALANCE_PATH)
 
 
 def get_balance_section(section: str) -> Dict[str, Any]:
@@ -2,49 +2,63 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
 from game.config import PROJECT_ROOT
 from game.events import EventSystem
+from game.jsonutil import load_path_cached
 
 _DIALOGUE_PATH = PROJECT_ROOT / "data" / "dialogue" / "bank.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogueChoice:
     id: str
     text: str
     next: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogueNode:
     node_id: str
-    lines: List[str]
-    choices: List[DialogueChoice]
+    lines: Tuple[str, ...]
+    choices: Tuple[DialogueChoice, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledNode:
+    """Bank entry flattened at load time so resolution is lookup-only."""
+
+    required: FrozenSet[str]
+    node: DialogueNode
 
 
 class DialogueManager:
     def __init__(self) -> None:
         if not _DIALOGUE_PATH.exists():
             raise FileNotFoundError(f"Dialogue bank missing at {_DIALOGUE_PATH}")
-        with _DIALOGUE_PATH.open("r", encoding="utf-8") as fh:
-            self._raw: Dict[str, Dict[str, Dict[str, object]]] = json.load(fh)
+        raw: Dict[str, Dict[str, Dict[str, object]]] = load_path_cached(_DIALOGUE_PATH)
+        self._nodes: Dict[Tuple[str, str], _CompiledNode] = {}
+        for character, definitions in raw.items():
+            for node_key, data in definitions.items():
+                lines = tuple(str(line) for line in data.get("lines", []))
+                choices = tuple(
+                    DialogueChoice(str(item.get("id")), str(item.get("text")), item.get("next"))
+                    for item in data.get("choices", [])
+                )
+                self._nodes[(character, node_key)] = _CompiledNode(
+                    required=frozenset(data.get("requires", [])),
+                    node=DialogueNode(node_key, lines, choices),
+                )
 
     def _resolve_node(self, character: str, node_key: str, events: EventSystem) -> DialogueNode | None:
-        definitions = self._raw.get(character, {})
-        data = definitions.get(node_key)
-        if not data:
+        compiled = self._nodes.get((character, node_key))
+        if compiled is None:
             return None
-        required: List[str] = data.get("requires", [])  # type: ignore[assignment]
-        if any(not events.was_triggered_today(flag) for flag in required):
+        if not compiled.required.issubset(events.daily.snapshot):
             return None
-        lines = [str(line) for line in data.get("lines", [])]
-        choices_data = data.get("choices", [])
-        choices = [DialogueChoice(str(item.get("id")), str(item.get("text")), item.get("next")) for item in choices_data]
-        return DialogueNode(node_key, lines, choices)
+        return compiled.node
 
     def start(self, character: str, preferred_nodes: List[str], events: EventSystem) -> DialogueNode | None:
         for node_key in preferred_nodes:
@@ -3,46 +3,87 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Set
+from typing import Dict, FrozenSet, Iterable, Optional, Set
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyEventLog:
     """Tracks events triggered during a single in-game day."""
 
     triggered: Set[str] = field(default_factory=set)
+    _snapshot: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False)
 
     def register(self, event_id: str) -> None:
         self.triggered.add(event_id)
+        self._snapshot = None
 
     def reset(self) -> None:
         self.triggered.clear()
+        self._snapshot = None
 
     def has(self, event_id: str) -> bool:
         return event_id in self.triggered
 
+    @property
+    def snapshot(self) -> FrozenSet[str]:
+        """Immutable view of today's events, rebuilt only after mutation.
 
-@dataclass
+        Dialogue resolution tests many requirement sets against the same
+        day state; handing out one frozenset lets those checks share it.
+        """
+
+        if self._snapshot is None:
+            self._snapshot = frozenset(self.triggered)
+        return self._snapshot
+
+
+@dataclass(slots=True)
 class PersistentFlags:
-    """Flags that carry over between days."""
+    """Flags that carry over between days.
+
+    Counters and boolean flags live in separate structures: running tallies
+    in ``counters`` and on/off flags as bare ``booleans`` membership. That
+    keeps 0/1 flags from paying dict-entry plus boxed-int overhead and makes
+    checking one a single set lookup.
+    """
 
-    values: Dict[str, int] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    booleans: Set[str] = field(default_factory=set)
 
     def bump(self, flag_id: str, amount: int = 1) -> None:
-        self.values[flag_id] = self.values.get(flag_id, 0) + amount
+        # Like set(), bump() owns both stores: it folds a boolean flag
+        # into the counter it increments rather than leaving it behind.
+        self.counters[flag_id] = self.get(flag_id) + amount
+        self.booleans.discard(flag_id)
 
     def set(self, flag_id: str, value: int) -> None:
-        self.values[flag_id] = value
+        # set() is authoritative: the flag leaves whichever structure it
+        # is not written to, so a stale entry can never shadow the new
+        # value on lookup, and non-boolean values round-trip intact.
+        if value == 0 or value == 1:
+            self.counters.pop(flag_id, None)
+            if value:
+                self.booleans.add(flag_id)
+            else:
+                self.booleans.discard(flag_id)
+        else:
+            self.booleans.discard(flag_id)
+            self.counters[flag_id] = value
 
     def get(self, flag_id: str, default: int = 0) -> int:
-        return self.values.get(flag_id, default)
+        if flag_id in self.counters:
+            return self.counters[flag_id]
+        if flag_id in self.booleans:
+            return 1
+        return default
 
     def clear_many(self, flags: Iterable[str]) -> None:
         for flag in flags:
-            self.values.pop(flag, None)
+            self.counters.pop(flag, None)
+            self.booleans.discard(flag)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSystem:
     """Container glued onto :class:`~game.state.GameState`."""
 
@@ -54,13 +95,14 @@ class EventSystem:
 
     def trigger(self, event_id: str) -> None:
         self.daily.register(event_id)
-        self.persistent.bump(f"count:{event_id}")
+        counters = self.persistent.counters
+        counters[event_id] = counters.get(event_id, 0) + 1
 
     def was_triggered_today(self, event_id: str) -> bool:
         return self.daily.has(event_id)
 
     def total_occurrences(self, event_id: str) -> int:
-        return self.persistent.get(f"count:{event_id}")
+        return self.persistent.counters.get(event_id, 0)
 
 
 __all__ = ["EventSystem"]
@@ -0,0 +1,61 @@
+"""Shared JSON helpers with an optional fast-path encoder.
+
+The prototype parses JSON in a few hot spots (balance hooks, AI settings,
+dialogue bank, HTTP payloads). When ``orjson`` is available we use its
+C-backed ``loads``/``dumps``; otherwise we fall back to the stdlib so the
+game stays runnable with only ``pygame`` installed.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+from functools import lru_cache
+from typing import Any
+
+try:  # pragma: no cover - depends on optional install
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+if orjson is not None:
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+else:
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+def load_path(path: pathlib.Path) -> Any:
+    """Parse a JSON file, feeding raw bytes to the fast decoder."""
+
+    return loads(path.read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _load_path_cached(path_str: str, mtime_ns: int) -> Any:
+    return loads(pathlib.Path(path_str).read_bytes())
+
+
+def load_path_cached(path: pathlib.Path) -> Any:
+    """Like :func:`load_path` but memoized on (path, mtime).
+
+    Repeated constructions (new clients, scene churn) hit memory instead of
+    re-reading and re-parsing, while edits to the file still invalidate the
+    entry. Mirrors the ``lru_cache`` already used by ``balance.load_balance``.
+    """
+
+    return _load_path_cached(str(path), path.stat().st_mtime_ns)
+
+
+__all__ = ["loads", "dumps", "load_path", "load_path_cached"]
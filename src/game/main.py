@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
-from game.ai.local_client import LocalAIClient
+from game.ai.local_client import LocalAIClient, LocalAISettings
 from game.config import BASE_HEIGHT, BASE_WIDTH
 from game.scene_controller import SceneController
 from game.state import GameState
@@ -21,32 +22,31 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
+    # Overlap the settings disk read/parse with pygame's subsystem init.
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings")
+    settings_future = loader.submit(LocalAISettings.load)
+    loader.shutdown(wait=False)
     pygame.init()
     flags = pygame.HIDDEN if args.headless else 0
     screen = pygame.display.set_mode((BASE_WIDTH, BASE_HEIGHT), flags=flags)
     pygame.display.set_caption("Nadiya Simulator")
 
     state = GameState()
-    ai_client = LocalAIClient()
+    ai_client = LocalAIClient(settings_future=settings_future)
     controller = SceneController(state, screen, ai_client)
 
     running = True
     max_headless_frames = 300 if args.headless else None
     frames = 0
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
-            else:
-                controller.handle_event(event)
+        running = controller.pump_and_dispatch()
         controller.update()
         if max_headless_frames is not None:
             frames += 1
             if frames >= max_headless_frames:
                 running = False
 
+    ai_client.close()
     pygame.quit()
     return 0
 
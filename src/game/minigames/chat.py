@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Deque, List
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -12,9 +12,13 @@ from game.balance import get_balance_section
 from game.ai.local_client import AIRequest, LocalAIClient
 from game.config import COLORS
 from game.state import GameState
+from game.ui.fonts import get_font
 
+# Ring capacity; a power of two so wrap-around is a mask instead of a modulo.
+_MSG_CAP = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class ChatMessage:
     speaker: str
     text: str
@@ -25,41 +29,64 @@ class ChatController:
         self.state = state
         self.surface = surface
         self.ai_client = ai_client
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 24)
-        self.messages: Deque[ChatMessage] = deque(maxlen=12)
-        self.input_buffer: List[str] = []
+        self.font = get_font(None, 28)
+        self.small_font = get_font(None, 24)
+        self._msg_buf: List[Optional[ChatMessage]] = [None] * _MSG_CAP
+        self._msg_head = 0
+        self._msg_count = 0
+        self._typed = ""
+        # Input line surface re-renders only when the typed text changes.
+        self._input_label: Optional[Tuple[str, pygame.Surface]] = None
         self.current_friend = "zara"
-        self.pending_request: int | None = None
         self.completed = False
         self.timer = 60.0
         self.summary: List[str] = []
-        self._evening_cfg = get_balance_section("segments").get("evening", {})
-        self._event_cfg = get_balance_section("events")
+        evening_cfg = get_balance_section("segments").get("evening", {})
+        self._ignore_threshold = float(get_balance_section("events").get("friend_ignore_threshold", 25))
+        self._chat_mood_penalty = float(evening_cfg.get("chat_mood_penalty", -2.0))
+        self._chat_mood_bonus = float(evening_cfg.get("chat_mood_bonus", 3.0))
+        # Message text is immutable once appended, so rendered lines are
+        # memoized; the helper line never changes and is rendered once.
+        self._line_cache: "OrderedDict[Tuple[str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+        # Static backdrop (fill color plus helper line) composed once; each
+        # frame starts from a single blit instead of a fill and re-render.
+        helper_surface = self.small_font.render(
+            "Enter to send • Backspace to delete • Tab to switch friend", True, COLORS.text_light
+        )
+        self._background = pygame.Surface(surface.get_size())
+        self._background.fill((18, 18, 26))
+        self._background.blit(helper_surface, (80, surface.get_height() - 80))
+        # Once the chat wraps up the frame is frozen until scene hand-off, so
+        # the final composition is kept and replayed as a single blit.
+        self._final_frame: Optional[pygame.Surface] = None
         self._bootstrap()
 
+    def _append_message(self, message: ChatMessage) -> None:
+        self._msg_buf[self._msg_head] = message
+        self._msg_head = (self._msg_head + 1) & (_MSG_CAP - 1)
+        self._msg_count = min(_MSG_CAP, self._msg_count + 1)
+
     def _bootstrap(self) -> None:
-        self.messages.append(ChatMessage(self.current_friend.capitalize(), "Hey chaotic fry hero, how is life?"))
+        self._append_message(ChatMessage(self.current_friend.capitalize(), "Hey chaotic fry hero, how is life?"))
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
-                text = "".join(self.input_buffer).strip()
+                text = self._typed.strip()
                 if text:
                     self._send_message(text)
-                    self.input_buffer.clear()
+                    self._typed = ""
             elif event.key == pygame.K_BACKSPACE:
-                if self.input_buffer:
-                    self.input_buffer.pop()
+                self._typed = self._typed[:-1]
             elif event.key == pygame.K_TAB:
                 self.current_friend = "lukas" if self.current_friend == "zara" else "zara"
-                self.messages.append(ChatMessage("System", f"Switched chat to {self.current_friend.capitalize()}"))
+                self._append_message(ChatMessage("System", f"Switched chat to {self.current_friend.capitalize()}"))
             else:
                 if event.unicode.isprintable():
-                    self.input_buffer.append(event.unicode)
+                    self._typed += event.unicode
 
     def _send_message(self, text: str) -> None:
-        self.messages.append(ChatMessage("Nadiya", text))
+        self._append_message(ChatMessage("Nadiya", text))
         self.state.apply_outcome(mood=1.0)
         persona = f"friend_{self.current_friend}"
         context = {
@@ -67,18 +94,17 @@ class ChatController:
             "day": str(self.state.day),
             "friend": self.current_friend,
         }
-        if self.state.relationships.friends.get(self.current_friend, 50.0) < self._event_cfg.get("friend_ignore_threshold", 25):
-            self.messages.append(ChatMessage(self.current_friend.capitalize(), "..."))
+        if self.state.relationships.friends.get(self.current_friend, 50.0) < self._ignore_threshold:
+            self._append_message(ChatMessage(self.current_friend.capitalize(), "..."))
             self.summary.append(f"{self.current_friend.capitalize()} left you on read.")
             self.state.events.trigger("friend_ignores_you")
-            penalty = float(self._evening_cfg.get("chat_mood_penalty", -2.0))
-            self.state.apply_outcome(mood=penalty)
+            self.state.apply_outcome(mood=self._chat_mood_penalty)
         else:
             request = AIRequest("Nadiya", persona, context, text)
-            self.pending_request = self.ai_client.submit(request, callback=self._receive_response)
+            self.ai_client.submit(request, callback=self._receive_response)
 
     def _receive_response(self, text: str) -> None:
-        self.messages.append(ChatMessage(self.current_friend.capitalize(), text))
+        self._append_message(ChatMessage(self.current_friend.capitalize(), text))
         self.state.relationships.adjust_friend(self.current_friend, 2.0)
         self.summary.append(f"{self.current_friend.capitalize()} boosted your mood with snark.")
 
@@ -86,26 +112,42 @@ class ChatController:
         self.timer -= dt
         if self.timer <= 0:
             self.completed = True
-            bonus = float(self._evening_cfg.get("chat_mood_bonus", 3.0))
-            self.state.apply_outcome(mood=bonus)
+            self.state.apply_outcome(mood=self._chat_mood_bonus)
             if not self.summary:
                 self.summary.append("Quiet night online but you still exhaled.")
 
+    def _render_line(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        cached = self._line_cache.get(key)
+        if cached is not None:
+            self._line_cache.move_to_end(key)
+            return cached
+        rendered = self.font.render(text, True, color)
+        self._line_cache[key] = rendered
+        if len(self._line_cache) > 64:
+            self._line_cache.popitem(last=False)
+        return rendered
+
     def render(self) -> None:
-        self.surface.fill((18, 18, 26))
+        if self._final_frame is not None:
+            self.surface.blit(self._final_frame, (0, 0))
+            return
+        self.surface.blit(self._background, (0, 0))
         y = 80
-        for message in self.messages:
+        idx = (self._msg_head - self._msg_count) & (_MSG_CAP - 1)
+        for _ in range(self._msg_count):
+            message = self._msg_buf[idx]
             color = COLORS.accent_ui if message.speaker == "Nadiya" else COLORS.text_light
-            render = self.font.render(f"{message.speaker}: {message.text}", True, color)
-            self.surface.blit(render, (80, y))
+            self.surface.blit(self._render_line(f"{message.speaker}: {message.text}", color), (80, y))
             y += 32
+            idx = (idx + 1) & (_MSG_CAP - 1)
 
-        input_text = "".join(self.input_buffer)
-        input_surface = self.font.render(f"> {input_text}", True, COLORS.accent_fries)
-        self.surface.blit(input_surface, (80, self.surface.get_height() - 120))
+        if self._input_label is None or self._input_label[0] != self._typed:
+            self._input_label = (self._typed, self.font.render(f"> {self._typed}", True, COLORS.accent_fries))
+        self.surface.blit(self._input_label[1], (80, self.surface.get_height() - 120))
 
-        helper_text = self.small_font.render("Enter to send • Backspace to delete • Tab to switch friend", True, COLORS.text_light)
-        self.surface.blit(helper_text, (80, self.surface.get_height() - 80))
+        if self.completed:
+            self._final_frame = self.surface.copy()
 
 
 __all__ = ["ChatController"]
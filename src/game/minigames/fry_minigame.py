@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import math
 import random
-from dataclasses import dataclass
 from typing import List
 
 import pygame
@@ -11,21 +11,39 @@ import pygame
 from game.balance import get_balance_section
 from game.config import COLORS, TILE_HEIGHT, TILE_WIDTH
 from game.state import GameState
+from game.ui.fonts import get_font
 
+# Unit diagonals, pre-normalized so spawning never calls Vector2.normalize.
+_HALF_SQRT2 = math.sqrt(0.5)
+_SPLASH_DIRECTIONS = (
+    (_HALF_SQRT2, _HALF_SQRT2),
+    (-_HALF_SQRT2, _HALF_SQRT2),
+    (_HALF_SQRT2, -_HALF_SQRT2),
+    (-_HALF_SQRT2, -_HALF_SQRT2),
+)
 
-@dataclass
-class OilSplash:
-    position: pygame.math.Vector2
-    velocity: pygame.math.Vector2
-    ttl: float
+# Half-tile extents shared by the grid bake and every projection.
+_HALF_W = TILE_WIDTH // 2
+_HALF_H = TILE_HEIGHT // 2
 
 
 class FryMinigameController:
+    # Built once; handle_event previously rebuilt this dict per keypress.
+    # Values are pre-built direction vectors, so keypresses allocate nothing
+    # (_move_player only reads them).
+    _MOVE_KEYS = {
+        pygame.K_w: pygame.math.Vector2(0, -1),
+        pygame.K_s: pygame.math.Vector2(0, 1),
+        pygame.K_a: pygame.math.Vector2(-1, 0),
+        pygame.K_d: pygame.math.Vector2(1, 0),
+    }
+    _FLIP_KEYS = frozenset((pygame.K_SPACE, pygame.K_RETURN))
+
     def __init__(self, state: GameState, surface: pygame.Surface) -> None:
         self.state = state
         self.surface = surface
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 28)
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 28)
         self.player_pos = pygame.math.Vector2(2, 2)
         self.fryer_tile = pygame.math.Vector2(3, 2)
         self.timer = 45.0
@@ -34,19 +52,57 @@ class FryMinigameController:
         self.flip_window = float(config.get("flip_window", 1.0))
         self.flips_done = 0
         self.flips_needed = int(config.get("flips_needed", 3))
-        self.oil_splashes: List[OilSplash] = []
+        # Splash state is kept struct-of-arrays style in parallel float
+        # lists; update runs one fused pass of scalar math over them
+        # instead of touching Vector2 methods per splash.
+        self._splash_px: List[float] = []
+        self._splash_py: List[float] = []
+        self._splash_vx: List[float] = []
+        self._splash_vy: List[float] = []
+        self._splash_ttl: List[float] = []
         self.hit_counter = 0
+        # Squared-distance thresholds; comparisons never need the sqrt.
+        self._hit_radius2 = 0.5 * 0.5
+        self._flip_range2 = 1.1 * 1.1
         self.completed = False
         self.win = False
         self.summary: List[str] = []
-        self._config = config
+        # Balance knobs resolved to plain numbers up front; the hot paths
+        # never re-run dict gets or float() casts.
+        self._hit_penalty = float(config.get("hit_mood_penalty", -2.0))
+        self._success_hits = int(config.get("success_hits", 1))
+        reward = config.get("success_reward", {})
+        self._reward_mood = float(reward.get("mood", 8.0))
+        self._reward_hunger = float(reward.get("hunger", 12.0))
+        self._reward_energy = float(reward.get("energy", -5.0))
+        fail_penalty = config.get("fail_penalty", {})
+        self._fail_mood = float(fail_penalty.get("mood", -6.0))
+        self._fail_energy = float(fail_penalty.get("energy", -8.0))
+        # The projection origin never moves, so compute it once here; the
+        # grid surface is baked against the same origin.
+        self._origin = (surface.get_width() // 2, 220)
+        self._grid_surface = self._build_grid_surface()
+        # Splashes all share one radius, so rasterize the circle once and
+        # batch-blit copies instead of midpoint-drawing each per frame.
+        self._splash_sprite = pygame.Surface((22, 22), pygame.SRCALPHA)
+        pygame.draw.circle(self._splash_sprite, COLORS.accent_ui, (11, 11), 10)
+        # The cook disc is likewise baked once; _draw_player just blits it.
+        self._cook_sprite = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(self._cook_sprite, COLORS.accent_cool, (20, 20), 20)
+        # HUD labels re-render only when their underlying value changes.
+        self._time_label: tuple[int, pygame.Surface] | None = None
+        self._flips_label: tuple[int, pygame.Surface] | None = None
+        self._hits_label: tuple[int, pygame.Surface] | None = None
+        # After _finish the frame is static until scene hand-off, so the
+        # final composition is kept and replayed as a single blit.
+        self._final_frame: pygame.Surface | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
-            move = {pygame.K_w: (0, -1), pygame.K_s: (0, 1), pygame.K_a: (-1, 0), pygame.K_d: (1, 0)}.get(event.key)
-            if move:
-                self._move_player(pygame.math.Vector2(move))
-            elif event.key in (pygame.K_SPACE, pygame.K_RETURN):
+            move = self._MOVE_KEYS.get(event.key)
+            if move is not None:
+                self._move_player(move)
+            elif event.key in self._FLIP_KEYS:
                 self._attempt_flip()
 
     def update(self, dt: float) -> None:
@@ -62,67 +118,115 @@ class FryMinigameController:
             self._spawn_splashes()
             self.flip_timer = random.uniform(4.0, 7.0)
 
-        for splash in list(self.oil_splashes):
-            splash.ttl -= dt
-            splash.position += splash.velocity * dt
-            if splash.ttl <= 0:
-                self.oil_splashes.remove(splash)
+        self._update_splashes(dt)
+
+    def _update_splashes(self, dt: float) -> None:
+        xs, ys = self._splash_px, self._splash_py
+        vxs, vys, ttls = self._splash_vx, self._splash_vy, self._splash_ttl
+        player_x, player_y = self.player_pos.x, self.player_pos.y
+        hit_radius2 = self._hit_radius2
+        hits = 0
+        # Single-pass write-index compaction: survivors slide left in place,
+        # so no per-frame list allocation and no O(n) removal scans. Only
+        # locals are touched inside the loop; instance state is folded back
+        # in afterwards.
+        write = 0
+        for i in range(len(xs)):
+            ttl = ttls[i] - dt
+            if ttl <= 0:
                 continue
-            if splash.position.distance_to(self.player_pos) < 0.5:
-                self.hit_counter += 1
-                penalty = float(self._config.get("hit_mood_penalty", -2.0))
-                self.state.apply_outcome(mood=penalty)
-                self.oil_splashes.remove(splash)
+            x = xs[i] + vxs[i] * dt
+            y = ys[i] + vys[i] * dt
+            dx = x - player_x
+            dy = y - player_y
+            if dx * dx + dy * dy < hit_radius2:
+                hits += 1
+                continue
+            xs[write] = x
+            ys[write] = y
+            vxs[write] = vxs[i]
+            vys[write] = vys[i]
+            ttls[write] = ttl
+            write += 1
+        del xs[write:], ys[write:], vxs[write:], vys[write:], ttls[write:]
+        if hits:
+            self.hit_counter += hits
+            self.state.apply_outcome(mood=self._hit_penalty * hits)
 
     def render(self) -> None:
+        if self._final_frame is not None:
+            self.surface.blit(self._final_frame, (0, 0))
+            return
         self.surface.fill((34, 24, 18))
-        origin = (self.surface.get_width() // 2, 220)
-        self._draw_grid(origin)
+        origin = self._origin
+        self.surface.blit(self._grid_surface, (0, 0))
         self._draw_player(origin)
         self._draw_fryer(origin)
         self._draw_splashes(origin)
-        timer_surface = self.font.render(f"Time: {int(self.timer)}", True, COLORS.text_light)
-        flips_surface = self.font.render(f"Flips: {self.flips_done}/{self.flips_needed}", True, COLORS.accent_fries)
-        hits_surface = self.small_font.render(f"Oil hits: {self.hit_counter}", True, COLORS.accent_ui)
-        self.surface.blit(timer_surface, (80, 420))
-        self.surface.blit(flips_surface, (80, 460))
-        self.surface.blit(hits_surface, (80, 500))
+        seconds = int(self.timer)
+        if self._time_label is None or self._time_label[0] != seconds:
+            self._time_label = (seconds, self.font.render(f"Time: {seconds}", True, COLORS.text_light))
+        if self._flips_label is None or self._flips_label[0] != self.flips_done:
+            self._flips_label = (
+                self.flips_done,
+                self.font.render(f"Flips: {self.flips_done}/{self.flips_needed}", True, COLORS.accent_fries),
+            )
+        if self._hits_label is None or self._hits_label[0] != self.hit_counter:
+            self._hits_label = (self.hit_counter, self.small_font.render(f"Oil hits: {self.hit_counter}", True, COLORS.accent_ui))
+        self.surface.blit(self._time_label[1], (80, 420))
+        self.surface.blit(self._flips_label[1], (80, 460))
+        self.surface.blit(self._hits_label[1], (80, 500))
         if self.completed:
             result = "Perfect fries!" if self.win else "Fries ruined"
             result_surface = self.font.render(result, True, COLORS.text_light)
             self.surface.blit(result_surface, (80, 560))
+            self._final_frame = self.surface.copy()
+
+    def _build_grid_surface(self) -> pygame.Surface:
+        """Rasterize the static tile diamonds once; render just blits them."""
 
-    def _draw_grid(self, origin: tuple[int, int]) -> None:
+        grid = pygame.Surface(self.surface.get_size(), pygame.SRCALPHA)
+        origin = self._origin
         for y in range(5):
             for x in range(6):
-                cx = (x - y) * TILE_WIDTH // 2 + origin[0]
-                cy = (x + y) * TILE_HEIGHT // 2 + origin[1]
+                cx = (x - y) * _HALF_W + origin[0]
+                cy = (x + y) * _HALF_H + origin[1]
                 color = COLORS.warm_neutral if (x, y) != (3, 2) else COLORS.accent_fries
                 points = [
-                    (cx, cy - TILE_HEIGHT // 2),
-                    (cx + TILE_WIDTH // 2, cy),
-                    (cx, cy + TILE_HEIGHT // 2),
-                    (cx - TILE_WIDTH // 2, cy)
+                    (cx, cy - _HALF_H),
+                    (cx + _HALF_W, cy),
+                    (cx, cy + _HALF_H),
+                    (cx - _HALF_W, cy)
                 ]
-                pygame.draw.polygon(self.surface, color, points)
-                pygame.draw.polygon(self.surface, COLORS.warm_dark, points, 2)
+                pygame.draw.polygon(grid, color, points)
+                pygame.draw.polygon(grid, COLORS.warm_dark, points, 2)
+        return grid
 
     def _draw_player(self, origin: tuple[int, int]) -> None:
-        px = (self.player_pos.x - self.player_pos.y) * TILE_WIDTH // 2 + origin[0]
-        py = (self.player_pos.x + self.player_pos.y) * TILE_HEIGHT // 2 + origin[1] - 20
-        pygame.draw.circle(self.surface, COLORS.accent_cool, (int(px), int(py)), 20)
+        ox, oy = origin
+        px, py = self.player_pos.x, self.player_pos.y
+        self.surface.blit(self._cook_sprite, (int((px - py) * _HALF_W) + ox - 20, int((px + py) * _HALF_H) + oy - 40))
 
     def _draw_fryer(self, origin: tuple[int, int]) -> None:
-        fx = (self.fryer_tile.x - self.fryer_tile.y) * TILE_WIDTH // 2 + origin[0]
-        fy = (self.fryer_tile.x + self.fryer_tile.y) * TILE_HEIGHT // 2 + origin[1] - 16
+        half_w, half_h = _HALF_W, _HALF_H
+        ox, oy = origin
+        tx, ty = self.fryer_tile.x, self.fryer_tile.y
+        fx = int((tx - ty) * half_w) + ox
+        fy = int((tx + ty) * half_h) + oy - 16
         pygame.draw.rect(self.surface, COLORS.warm_dark, (fx - 24, fy - 24, 48, 48))
         pygame.draw.rect(self.surface, COLORS.accent_fries, (fx - 20, fy - 20, 40, 40))
 
     def _draw_splashes(self, origin: tuple[int, int]) -> None:
-        for splash in self.oil_splashes:
-            sx = (splash.position.x - splash.position.y) * TILE_WIDTH // 2 + origin[0]
-            sy = (splash.position.x + splash.position.y) * TILE_HEIGHT // 2 + origin[1] - 12
-            pygame.draw.circle(self.surface, COLORS.accent_ui, (int(sx), int(sy)), 10)
+        sprite = self._splash_sprite
+        half_w, half_h = _HALF_W, _HALF_H
+        ox, oy = origin[0] - 11, origin[1] - 23  # -12 splash lift, -11 sprite center
+        self.surface.blits(
+            [
+                (sprite, (int((x - y) * half_w) + ox, int((x + y) * half_h) + oy))
+                for x, y in zip(self._splash_px, self._splash_py)
+            ],
+            doreturn=False,
+        )
 
     def _move_player(self, direction: pygame.math.Vector2) -> None:
         self.player_pos += direction
@@ -132,8 +236,7 @@ class FryMinigameController:
     def _attempt_flip(self) -> None:
         if self.completed:
             return
-        distance = self.player_pos.distance_to(self.fryer_tile)
-        if distance <= 1.1:
+        if self.player_pos.distance_squared_to(self.fryer_tile) <= self._flip_range2:
             if self.flip_timer <= self.flip_window:
                 self.flips_done += 1
                 self.state.apply_outcome(mood=4.0, hunger=8.0)
@@ -145,33 +248,35 @@ class FryMinigameController:
             self.state.apply_outcome(mood=-1.0)
 
     def _spawn_splashes(self) -> None:
-        for _ in range(random.randint(1, 3)):
-            start = self.fryer_tile + pygame.math.Vector2(random.uniform(-0.3, 0.3), random.uniform(-0.3, 0.3))
-            angle = random.choice([(1, 1), (-1, 1), (1, -1), (-1, -1)])
-            velocity = pygame.math.Vector2(angle).normalize() * random.uniform(1.8, 2.5)
-            ttl = random.uniform(1.2, 1.8)
-            self.oil_splashes.append(OilSplash(start, velocity, ttl))
+        # One bound random.random drives every draw; uniforms come from
+        # scale-and-shift arithmetic instead of separate uniform/choice/
+        # randint calls with their per-call argument handling.
+        rand = random.random
+        fryer_x, fryer_y = self.fryer_tile.x, self.fryer_tile.y
+        for _ in range(1 + int(rand() * 3)):
+            dir_x, dir_y = _SPLASH_DIRECTIONS[int(rand() * 4)]
+            speed = 1.8 + 0.7 * rand()
+            self._splash_px.append(fryer_x + (rand() - 0.5) * 0.6)
+            self._splash_py.append(fryer_y + (rand() - 0.5) * 0.6)
+            self._splash_vx.append(dir_x * speed)
+            self._splash_vy.append(dir_y * speed)
+            self._splash_ttl.append(1.2 + 0.6 * rand())
 
     def _finish(self, success: bool) -> None:
         self.completed = True
         self.win = success
         if success:
-            reward = self._config.get("success_reward", {})
             self.state.apply_outcome(
-                mood=float(reward.get("mood", 8.0)),
-                hunger=float(reward.get("hunger", 12.0)),
-                energy=float(reward.get("energy", -5.0)),
+                mood=self._reward_mood,
+                hunger=self._reward_hunger,
+                energy=self._reward_energy,
             )
             self.summary.append("Crisp fries served with only minor grease casualties.")
-            if self.hit_counter <= int(self._config.get("success_hits", 1)):
+            if self.hit_counter <= self._success_hits:
                 self.state.events.trigger("perfect_fries_day")
                 self.summary.append("Perfect fry form unlocked a confidence spark.")
         else:
-            penalty = self._config.get("fail_penalty", {})
-            self.state.apply_outcome(
-                mood=float(penalty.get("mood", -6.0)),
-                energy=float(penalty.get("energy", -8.0)),
-            )
+            self.state.apply_outcome(mood=self._fail_mood, energy=self._fail_energy)
             self.state.events.trigger("grease_fire_close_call")
             self.summary.append("Grease fought back tonight. Bandages acquired.")
         self.summary.append(f"Oil hits taken: {self.hit_counter}")
@@ -4,37 +4,38 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import List, Tuple
 
 import pygame
 
 from game.balance import get_balance_section
 from game.config import COLORS
 from game.state import GameState
+from game.ui.fonts import get_font
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Question:
     prompt: str
-    options: Sequence[str]
+    options: Tuple[str, ...]
     correct_index: int
 
 
-QUESTIONS: List[Question] = [
-    Question("Choose the correct article: ___ Kaffee", ["Der", "Die", "Das"], 0),
-    Question("Wie sagt man 'tired' auf Deutsch?", ["müde", "kalt", "heiß"], 0),
-    Question("Welches Wort passt? Ich ___ Pommes.", ["esst", "esse", "isst"], 1),
-    Question("Ordne: Morgen / zur / ich / Schule / gehe", ["Ich gehe zur Schule morgen", "Morgen gehe ich zur Schule", "Zur Schule gehe ich morgen"], 1),
-    Question("Was ist die Mehrzahl von 'Freund'?", ["Freunde", "Freunder", "Freunden"], 0),
-]
+QUESTIONS: Tuple[Question, ...] = (
+    Question("Choose the correct article: ___ Kaffee", ("Der", "Die", "Das"), 0),
+    Question("Wie sagt man 'tired' auf Deutsch?", ("müde", "kalt", "heiß"), 0),
+    Question("Welches Wort passt? Ich ___ Pommes.", ("esst", "esse", "isst"), 1),
+    Question("Ordne: Morgen / zur / ich / Schule / gehe", ("Ich gehe zur Schule morgen", "Morgen gehe ich zur Schule", "Zur Schule gehe ich morgen"), 1),
+    Question("Was ist die Mehrzahl von 'Freund'?", ("Freunde", "Freunder", "Freunden"), 0),
+)
 
 
 class GermanTestController:
     def __init__(self, state: GameState, screen: pygame.Surface) -> None:
         self.state = state
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 28)
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 28)
         self.current_questions = random.sample(QUESTIONS, k=3)
         self.current_index = 0
         self.selected_option = 0
@@ -43,7 +44,31 @@ class GermanTestController:
         self.feedback_timer = 0.0
         self.last_feedback = ""
         self.summary: List[str] = []
-        self._config = get_balance_section("school")
+        # Balance knobs resolved to plain numbers up front, matching the
+        # other minigames; _apply_result never re-probes the section dict.
+        config = get_balance_section("school")
+        pass_cfg = config.get("quiz_pass", {})
+        self._pass_mood = float(pass_cfg.get("mood", 10.0))
+        self._pass_xp = float(pass_cfg.get("german_xp", 45.0))
+        self._partial_mood = float(pass_cfg.get("mood", 6.0)) * 0.6
+        self._partial_xp = float(pass_cfg.get("german_xp", 45.0)) * 0.5
+        self._fail_mood = float(config.get("quiz_fail", {}).get("mood", -6.0))
+        # Quiz text is fixed once the questions are drawn, so every prompt
+        # and both highlight variants of every option are rendered up front;
+        # render just picks surfaces by index.
+        self._prompt_surfs = [self.font.render(q.prompt, True, COLORS.text_light) for q in self.current_questions]
+        self._option_surfs = [
+            [
+                (
+                    self.small_font.render(f"{i + 1}. {opt}", True, COLORS.text_light),
+                    self.small_font.render(f"{i + 1}. {opt}", True, COLORS.accent_ui),
+                )
+                for i, opt in enumerate(q.options)
+            ]
+            for q in self.current_questions
+        ]
+        self._feedback_label: tuple[str, pygame.Surface] | None = None
+        self._summary_label: pygame.Surface | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -63,20 +88,21 @@ class GermanTestController:
     def render(self) -> None:
         self.screen.fill((20, 16, 16))
         if self.completed and self.feedback_timer <= 0:
-            summary = self.font.render(f"Correct answers: {self.correct_answers}/ {len(self.current_questions)}", True, COLORS.text_light)
-            self.screen.blit(summary, (80, 120))
+            if self._summary_label is None:
+                self._summary_label = self.font.render(
+                    f"Correct answers: {self.correct_answers}/ {len(self.current_questions)}", True, COLORS.text_light
+                )
+            self.screen.blit(self._summary_label, (80, 120))
             return
 
-        question_surface = self.font.render(self.current_question.prompt, True, COLORS.text_light)
-        self.screen.blit(question_surface, (80, 80))
-        for idx, option in enumerate(self.current_question.options):
-            color = COLORS.accent_ui if idx == self.selected_option else COLORS.text_light
-            option_surface = self.small_font.render(f"{idx + 1}. {option}", True, color)
-            self.screen.blit(option_surface, (100, 140 + idx * 40))
+        self.screen.blit(self._prompt_surfs[self.current_index], (80, 80))
+        for idx, variants in enumerate(self._option_surfs[self.current_index]):
+            self.screen.blit(variants[idx == self.selected_option], (100, 140 + idx * 40))
 
         if self.feedback_timer > 0:
-            feedback_surface = self.small_font.render(self.last_feedback, True, COLORS.accent_fries)
-            self.screen.blit(feedback_surface, (80, 280))
+            if self._feedback_label is None or self._feedback_label[0] != self.last_feedback:
+                self._feedback_label = (self.last_feedback, self.small_font.render(self.last_feedback, True, COLORS.accent_fries))
+            self.screen.blit(self._feedback_label[1], (80, 280))
 
     @property
     def current_question(self) -> Question:
@@ -99,23 +125,14 @@ class GermanTestController:
     def _apply_result(self) -> None:
         total_questions = len(self.current_questions)
         if self.correct_answers >= total_questions - 0:
-            cfg = self._config.get("quiz_pass", {})
-            self.state.apply_outcome(
-                mood=float(cfg.get("mood", 10.0)),
-                german_xp=float(cfg.get("german_xp", 45.0)),
-            )
+            self.state.apply_outcome(mood=self._pass_mood, german_xp=self._pass_xp)
             self.summary.append("Crushed the German quiz. Teacher almost smiled.")
             self.state.events.trigger("quiz_streak")
         elif self.correct_answers >= total_questions // 2:
-            cfg = self._config.get("quiz_pass", {})
-            self.state.apply_outcome(
-                mood=float(cfg.get("mood", 6.0)) * 0.6,
-                german_xp=float(cfg.get("german_xp", 45.0)) * 0.5,
-            )
+            self.state.apply_outcome(mood=self._partial_mood, german_xp=self._partial_xp)
             self.summary.append("Passed the quiz with scrapes but still breathing.")
         else:
-            fail_cfg = self._config.get("quiz_fail", {})
-            self.state.apply_outcome(mood=float(fail_cfg.get("mood", -6.0)))
+            self.state.apply_outcome(mood=self._fail_mood)
             self.summary.append("German grammar riot: quiz went sideways.")
             self.state.events.trigger("german_test_flunk")
 
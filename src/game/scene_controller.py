@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Callable
 
 import pygame
@@ -18,6 +19,15 @@ from game.scenes.transition import TransitionScene
 from game.state import GameState, TimeSegment
 from game.ui.hud import HUD
 
+# Simulation advances in fixed slices regardless of frame time, so timers
+# and splash physics step deterministically while rendering happens once
+# per display frame.
+_FIXED_DT = 1.0 / 60.0
+_FRAME_BUDGET = 1.0 / FPS
+
+# The game is keyboard-driven; everything else never reaches Python.
+_RELEVANT_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+
 
 class SceneController:
     def __init__(self, state: GameState, screen: pygame.Surface, ai_client: LocalAIClient) -> None:
@@ -29,9 +39,40 @@ class SceneController:
         self.transition_scene: TransitionScene | None = None
         self._pending_segment: TimeSegment | None = None
         self._pending_factory: Callable[[], Scene] | None = None
-        self.clock = pygame.time.Clock()
+        self._accum = 0.0
+        self._last_time = time.perf_counter()
         self._switch_scene(TimeSegment.MORNING)
 
+    def pump_and_dispatch(self) -> bool:
+        """Drain the SDL queue once per frame; returns False on quit.
+
+        Only the event types the game reacts to are pulled through Python
+        dispatch; everything else (mouse-motion floods and the like) is
+        discarded in one C-level clear.
+        """
+
+        if self.is_idle():
+            # Nothing animates and nothing is pending: sleep in SDL until
+            # input arrives (or the timeout passes) instead of spinning.
+            first = pygame.event.wait(100)
+            if first.type == pygame.QUIT:
+                return False
+            if first.type == pygame.KEYDOWN:
+                if first.key == pygame.K_ESCAPE:
+                    return False
+                self.handle_event(first)
+        for event in pygame.event.get(_RELEVANT_EVENTS):
+            if event.type == pygame.QUIT:
+                return False
+            if event.key == pygame.K_ESCAPE:
+                return False
+            self.handle_event(event)
+        pygame.event.clear()
+        return True
+
+    def is_idle(self) -> bool:
+        return self.transition_scene is None and self.active_scene is not None and self.active_scene.is_idle()
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if self.transition_scene:
             self.transition_scene.handle_event(event)
@@ -40,21 +81,44 @@ class SceneController:
             self.active_scene.handle_event(event)
 
     def update(self) -> None:
-        dt = self.clock.tick(FPS) / 1000.0
+        now = time.perf_counter()
+        frame_dt = now - self._last_time
+        self._last_time = now
+        # Clamp stalls so one long hitch doesn't cascade into a burst of
+        # catch-up steps.
+        self._accum += min(frame_dt, 0.25)
+        while self._accum >= _FIXED_DT:
+            self._step(_FIXED_DT)
+            self._accum -= _FIXED_DT
+        self._render()
+        # Sleep off whatever remains of this frame's budget so the loop
+        # caps at FPS; dt measurement stays on perf_counter above.
+        remaining = _FRAME_BUDGET - (time.perf_counter() - now)
+        if remaining > 0:
+            pygame.time.wait(int(remaining * 1000))
+
+    def _step(self, dt: float) -> None:
         if self.transition_scene:
             self.transition_scene.update(dt)
             if self.transition_scene.completed:
                 self.transition_scene = None
                 self._activate_pending()
-            self._render()
             return
         if self.active_scene:
             self.active_scene.update(dt)
             if self.active_scene.completed:
                 self._advance()
-        self._render()
 
     def _render(self) -> None:
+        # Static frames (e.g. the sleep screen with unchanged HUD values)
+        # skip the redraw and the display present entirely; the previous
+        # frame stays on screen.
+        if self.transition_scene:
+            scene_dirty = self.transition_scene.is_dirty()
+        else:
+            scene_dirty = self.active_scene.is_dirty() if self.active_scene else False
+        if not scene_dirty and not self.hud.is_dirty(self.state):
+            return
         if self.active_scene:
             self.active_scene.render(self.screen)
         if self.transition_scene:
@@ -62,41 +126,20 @@ class SceneController:
         self.hud.render(self.state)
         pygame.display.flip()
 
+    def sleep_factory(self) -> Callable[[], Scene]:
+        return lambda: SleepScene(self.state, self.screen)
+
     def _advance(self) -> None:
         if not self.active_scene:
             return
-        summary = self.active_scene.get_summary()
-        next_segment = self.state.segment
-        factory = None
-        if isinstance(self.active_scene, MomScene):
-            factory = lambda: SleepScene(self.state, self.screen)
-            next_segment = TimeSegment.NIGHT
-        elif isinstance(self.active_scene, SleepScene):
-            next_segment = self.state.segment
-        else:
-            self.state.advance_segment()
-            next_segment = self.state.segment
-            if self.state.should_force_rest() and next_segment != TimeSegment.NIGHT:
-                summary = list(summary) + ["Body begged for rest; skipping ahead to night."]
-                next_segment = TimeSegment.NIGHT
-                self.state.segment = TimeSegment.NIGHT
-                self.state.events.trigger("forced_rest")
-                factory = lambda: SleepScene(self.state, self.screen)
+        summary, next_segment, factory = self.active_scene.transition_plan(self)
         self._queue_transition(summary, next_segment, factory)
 
     def _switch_scene(self, segment: TimeSegment) -> None:
         if self.active_scene:
             self.active_scene.on_exit()
-        if segment == TimeSegment.MORNING:
-            self.active_scene = SchoolScene(self.state, self.screen)
-        elif segment == TimeSegment.AFTERNOON:
-            self.active_scene = KitchenScene(self.state, self.screen)
-        elif segment == TimeSegment.EVENING:
-            self.active_scene = ChatScene(self.state, self.screen, self.ai_client)
-        elif segment == TimeSegment.NIGHT:
-            self.active_scene = MomScene(self.state, self.ai_client, self.screen)
-        else:
-            self.active_scene = SleepScene(self.state, self.screen)
+        builder = _SCENE_BUILDERS.get(segment, _build_sleep)
+        self.active_scene = builder(self)
         self.active_scene.on_enter()
 
     def _queue_transition(self, summary: list[str], next_segment: TimeSegment, factory: Callable[[], Scene] | None) -> None:
@@ -122,4 +165,15 @@ class SceneController:
             self._pending_segment = None
 
 
+# Scene builders keyed by segment, built once at import; switching is a
+# single dict lookup instead of an elif ladder.
+_SCENE_BUILDERS: dict[TimeSegment, Callable[[SceneController], Scene]] = {
+    TimeSegment.MORNING: lambda c: SchoolScene(c.state, c.screen),
+    TimeSegment.AFTERNOON: lambda c: KitchenScene(c.state, c.screen),
+    TimeSegment.EVENING: lambda c: ChatScene(c.state, c.screen, c.ai_client),
+    TimeSegment.NIGHT: lambda c: MomScene(c.state, c.ai_client, c.screen),
+}
+_build_sleep: Callable[[SceneController], Scene] = lambda c: SleepScene(c.state, c.screen)
+
+
 __all__ = ["SceneController"]
@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING, Callable
+
 import pygame
 
-from game.state import GameState
+from game.state import GameState, TimeSegment
+
+if TYPE_CHECKING:
+    from game.scene_controller import SceneController
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_summary(scene_cls: type) -> str:
+    """One placeholder line per scene class, built on first use."""
+
+    return scene_cls.__name__.replace("Scene", "") + " wrapped without drama."
 
 
 class Scene:
@@ -13,6 +26,7 @@ class Scene:
     def __init__(self, state: GameState) -> None:
         self.state = state
         self.completed = False
+        self.summary: list[str] = []
 
     def handle_event(self, event: pygame.event.Event) -> None:
         raise NotImplementedError
@@ -23,18 +37,57 @@ class Scene:
     def render(self, surface: pygame.Surface) -> None:
         raise NotImplementedError
 
+    def is_dirty(self) -> bool:
+        """Whether the scene needs a redraw this frame.
+
+        Animated scenes keep the default; static ones can return False
+        once drawn so the controller skips the present entirely.
+        """
+
+        return True
+
+    def is_idle(self) -> bool:
+        """Whether the scene is purely waiting on player input.
+
+        Idle scenes let the controller block in the OS event wait
+        instead of spinning at frame rate; anything with timers or
+        animation keeps the default.
+        """
+
+        return False
+
     def on_enter(self) -> None:
         """Called when the scene becomes active."""
 
     def on_exit(self) -> None:
         """Called before the scene transitions out."""
 
+    def transition_plan(self, controller: SceneController) -> tuple[list[str], TimeSegment, Callable[[], Scene] | None]:
+        """Summary lines, next segment and optional scene factory at hand-off.
+
+        The default advances the day segment and folds in forced rest;
+        scenes with bespoke flows override it.
+        """
+
+        state = self.state
+        summary = self.get_summary()
+        state.advance_segment()
+        next_segment = state.segment
+        factory = None
+        if state.should_force_rest() and next_segment != TimeSegment.NIGHT:
+            summary = list(summary) + ["Body begged for rest; skipping ahead to night."]
+            next_segment = TimeSegment.NIGHT
+            state.segment = TimeSegment.NIGHT
+            state.events.trigger("forced_rest")
+            factory = controller.sleep_factory()
+        return summary, next_segment, factory
+
     def get_summary(self) -> list[str]:
         """Return summary bullet lines for the transition screen."""
 
-        lines = [str(line) for line in getattr(self, "summary", []) if line]
+        lines = [line for line in self.summary if line]
         if not lines:
-            lines = [self.__class__.__name__.replace("Scene", "") + " wrapped without drama."]
+            lines = [_fallback_summary(type(self))]
         return lines
 
 
@@ -9,8 +9,12 @@ import pygame
 
 from game.config import COLORS, TILE_HEIGHT, TILE_WIDTH
 
+# Half-tile extents hoisted once; projections are a multiply-add per axis.
+_TW2 = TILE_WIDTH // 2
+_TH2 = TILE_HEIGHT // 2
 
-@dataclass
+
+@dataclass(slots=True)
 class Tile:
     kind: str
     walkable: bool
@@ -38,18 +42,18 @@ BLOCK_TILE = Tile("block", False)
 
 def iso_to_screen(grid_x: int, grid_y: int, origin: Tuple[int, int]) -> Tuple[int, int]:
     ox, oy = origin
-    screen_x = (grid_x - grid_y) * TILE_WIDTH // 2 + ox
-    screen_y = (grid_x + grid_y) * TILE_HEIGHT // 2 + oy
+    screen_x = (grid_x - grid_y) * _TW2 + ox
+    screen_y = (grid_x + grid_y) * _TH2 + oy
     return screen_x, screen_y
 
 
 def draw_tile(surface: pygame.Surface, position: Tuple[int, int], color: Tuple[int, int, int]) -> None:
     cx, cy = position
     points = [
-        (cx, cy - TILE_HEIGHT // 2),
-        (cx + TILE_WIDTH // 2, cy),
-        (cx, cy + TILE_HEIGHT // 2),
-        (cx - TILE_WIDTH // 2, cy)
+        (cx, cy - _TH2),
+        (cx + _TW2, cy),
+        (cx, cy + _TH2),
+        (cx - _TW2, cy)
     ]
     pygame.draw.polygon(surface, color, points)
     pygame.draw.polygon(surface, COLORS.warm_dark, points, 2)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import random
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Tuple
 
 import pygame
 
@@ -11,7 +13,11 @@ from game.ai.local_client import AIRequest, LocalAIClient
 from game.config import COLORS
 from game.dialogue import DialogueManager
 from game.scenes.base import Scene
-from game.state import GameState
+from game.state import GameState, TimeSegment
+from game.ui.fonts import get_font
+
+if TYPE_CHECKING:
+    from game.scene_controller import SceneController
 
 
 class MomScene(Scene):
@@ -19,8 +25,8 @@ class MomScene(Scene):
         super().__init__(state)
         self.ai_client = ai_client
         self.screen = screen
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 26)
+        self.font = get_font(None, 32)
+        self.small_font = get_font(None, 26)
         self.dialogue: list[str] = []
         self.choice_index = 0
         self.waiting_for_ai = False
@@ -29,6 +35,14 @@ class MomScene(Scene):
         self._active_choices: list[tuple[str, str]] = []
         self._mode = "neutral"
         self._events_cfg = get_balance_section("events")
+        # Dialogue lines and choice labels repeat across frames, so
+        # rendered surfaces are memoized; the typing indicator is static.
+        self._line_cache: "OrderedDict[Tuple[str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+        self._thinking_label = self.small_font.render("Mom is thinking...", True, COLORS.accent_cool)
+        # Monotonic revision bumped by anything that changes the frame;
+        # is_dirty compares it against the revision last drawn.
+        self._revision = 0
+        self._drawn_revision = -1
 
     def on_enter(self) -> None:
         self._mode = self._decide_mode()
@@ -45,9 +59,11 @@ class MomScene(Scene):
             self._active_choices = [("wrap", "Say goodnight")]
         self.dialogue.append("Mom: Hey kiddo, you're up late again.")
         self._trigger_ai()
+        self._revision += 1
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
+            self._revision += 1
             if event.key in (pygame.K_DOWN, pygame.K_s):
                 self.choice_index = (self.choice_index + 1) % max(1, len(self._active_choices))
             elif event.key in (pygame.K_UP, pygame.K_w):
@@ -60,23 +76,44 @@ class MomScene(Scene):
     def update(self, dt: float) -> None:
         pass
 
+    def is_idle(self) -> bool:
+        # The night chat only changes on input or when an AI reply lands.
+        return not self.waiting_for_ai and not self.completed
+
+    def is_dirty(self) -> bool:
+        return self._drawn_revision != self._revision
+
+    def transition_plan(self, controller: "SceneController") -> tuple[list[str], TimeSegment, Callable[[], Scene] | None]:
+        # Night always hands off to sleep without advancing the segment.
+        return self.get_summary(), TimeSegment.NIGHT, controller.sleep_factory()
+
+    def _render_line(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        cached = self._line_cache.get(key)
+        if cached is not None:
+            self._line_cache.move_to_end(key)
+            return cached
+        rendered = self.font.render(text, True, color)
+        self._line_cache[key] = rendered
+        if len(self._line_cache) > 64:
+            self._line_cache.popitem(last=False)
+        return rendered
+
     def render(self, surface: pygame.Surface) -> None:
         surface.fill((28, 26, 32))
         y = 100
         for line in self.dialogue[-6:]:
-            text_surface = self.font.render(line, True, COLORS.text_light)
-            surface.blit(text_surface, (80, y))
+            surface.blit(self._render_line(line, COLORS.text_light), (80, y))
             y += 40
 
         if not self.completed:
             for idx, choice in enumerate(self._active_choices):
                 _, label = choice
                 color = COLORS.accent_ui if idx == self.choice_index else COLORS.text_light
-                choice_surface = self.font.render(label, True, color)
-                surface.blit(choice_surface, (120, 420 + idx * 36))
+                surface.blit(self._render_line(label, color), (120, 420 + idx * 36))
         if self.waiting_for_ai:
-            typing_surface = self.small_font.render("Mom is thinking...", True, COLORS.accent_cool)
-            surface.blit(typing_surface, (120, 520))
+            surface.blit(self._thinking_label, (120, 520))
+        self._drawn_revision = self._revision
 
     def _trigger_ai(self) -> None:
         if self.waiting_for_ai:
@@ -95,6 +132,7 @@ class MomScene(Scene):
 
     def _on_ai_response(self, text: str) -> None:
         self.waiting_for_ai = False
+        self._revision += 1
         self.dialogue.append(f"Mom: {text}")
         if self._mode == "drunk":
             self.summary.append("Mom overshared stories with a soft slur.")
@@ -13,9 +13,21 @@ from game.config import COLORS, TILE_HEIGHT, TILE_WIDTH
 from game.minigames.german_test import GermanTestController
 from game.scenes.base import Scene
 from game.state import GameState
+from game.ui.fonts import get_font
 
+# Half-tile extents shared by the floor bake and the marker projections.
+_HALF_W = TILE_WIDTH // 2
+_HALF_H = TILE_HEIGHT // 2
 
-@dataclass
+# The hallway layout is static, so the map extents, wall cells and the
+# packed walkability mask are built once at import instead of per scene.
+_MAP_WIDTH = 6
+_MAP_HEIGHT = 6
+_WALLS = frozenset((x, 5) for x in range(_MAP_WIDTH))
+_WALLS_MASK = sum(1 << (wy * _MAP_WIDTH + wx) for wx, wy in _WALLS)
+
+
+@dataclass(slots=True)
 class NPC:
     grid_pos: pygame.math.Vector2
     direction: int
@@ -24,10 +36,23 @@ class NPC:
 
 
 class SchoolScene(Scene):
+    # Pre-built direction vectors keyed by both WASD and arrows; each
+    # keypress is one dict lookup with no Vector2 allocation.
+    _MOVE_KEYS = {
+        pygame.K_w: pygame.math.Vector2(0, -1),
+        pygame.K_UP: pygame.math.Vector2(0, -1),
+        pygame.K_s: pygame.math.Vector2(0, 1),
+        pygame.K_DOWN: pygame.math.Vector2(0, 1),
+        pygame.K_a: pygame.math.Vector2(-1, 0),
+        pygame.K_LEFT: pygame.math.Vector2(-1, 0),
+        pygame.K_d: pygame.math.Vector2(1, 0),
+        pygame.K_RIGHT: pygame.math.Vector2(1, 0),
+    }
+
     def __init__(self, state: GameState, screen: pygame.Surface) -> None:
         super().__init__(state)
         self.screen = screen
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(None, 32)
         self.player_pos = pygame.math.Vector2(2, 4)
         self.player_speed = 4.0
         self.npcs: List[NPC] = []
@@ -38,9 +63,21 @@ class SchoolScene(Scene):
         self._school_cfg = get_balance_section("school")
         self.summary: List[str] = []
         self.collisions_today = 0
-        self._map_width = 6
-        self._map_height = 6
-        self._walls = {(x, 5) for x in range(self._map_width)}
+        # The hallway layout never changes, so rasterize the tile diamonds
+        # once and blit the result each frame, as the fry grid does.
+        self._origin = (screen.get_width() // 2, 180)
+        self._floor_surface = self._build_floor_surface()
+        # Countdown label re-renders only when the displayed second changes.
+        self._timer_label: tuple[int, pygame.Surface] | None = None
+        # Entity discs are rasterized once and batch-blitted via blits;
+        # render does no per-frame circle drawing.
+        self._player_sprite = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(self._player_sprite, COLORS.accent_ui, (20, 20), 20)
+        calm_sprite = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.circle(calm_sprite, COLORS.warm_dark, (16, 16), 16)
+        annoying_sprite = pygame.Surface((32, 32), pygame.SRCALPHA)
+        pygame.draw.circle(annoying_sprite, COLORS.accent_fries, (16, 16), 16)
+        self._npc_sprites = (calm_sprite, annoying_sprite)
 
     def on_enter(self) -> None:
         morning_cfg = get_balance_section("segments")["morning"]
@@ -51,15 +88,7 @@ class SchoolScene(Scene):
             self.test_controller.handle_event(event)
             return
         if event.type == pygame.KEYDOWN:
-            direction = None
-            if event.key in (pygame.K_w, pygame.K_UP):
-                direction = pygame.math.Vector2(0, -1)
-            elif event.key in (pygame.K_s, pygame.K_DOWN):
-                direction = pygame.math.Vector2(0, 1)
-            elif event.key in (pygame.K_a, pygame.K_LEFT):
-                direction = pygame.math.Vector2(-1, 0)
-            elif event.key in (pygame.K_d, pygame.K_RIGHT):
-                direction = pygame.math.Vector2(1, 0)
+            direction = self._MOVE_KEYS.get(event.key)
             if direction is not None:
                 self._move_player(direction)
 
@@ -77,13 +106,18 @@ class SchoolScene(Scene):
             self._start_test()
             return
 
+        # Squared-distance collision test against hoisted player
+        # coordinates; no sqrt and no Vector2 method calls in the loop.
+        px, py = self.player_pos.x, self.player_pos.y
         for npc in list(self.npcs):
             npc.grid_pos.x += npc.speed * dt * npc.direction
             if npc.grid_pos.x < 0:
                 npc.grid_pos.x = 5
             elif npc.grid_pos.x > 5:
                 npc.grid_pos.x = 0
-            if npc.grid_pos.distance_to(self.player_pos) < 0.4:
+            dx = npc.grid_pos.x - px
+            dy = npc.grid_pos.y - py
+            if dx * dx + dy * dy < 0.16:
                 self._handle_collision(npc)
 
     def render(self, surface: pygame.Surface) -> None:
@@ -91,30 +125,45 @@ class SchoolScene(Scene):
         if self.in_test and self.test_controller:
             self.test_controller.render()
             return
-        origin = (surface.get_width() // 2, 180)
-        for y in range(self._map_height):
-            for x in range(self._map_width):
-                cx = (x - y) * TILE_WIDTH // 2 + origin[0]
-                cy = (x + y) * TILE_HEIGHT // 2 + origin[1]
-                if (x, y) in self._walls:
+        origin = self._origin
+        surface.blit(self._floor_surface, (0, 0))
+
+        ox, oy = origin
+        px, py = self.player_pos.x, self.player_pos.y
+        draws = [(self._player_sprite, (int((px - py) * _HALF_W) + ox - 20, int((px + py) * _HALF_H) + oy - 38))]
+        npc_sprites = self._npc_sprites
+        for npc in self.npcs:
+            nx, ny = npc.grid_pos.x, npc.grid_pos.y
+            draws.append((npc_sprites[npc.annoying], (int((nx - ny) * _HALF_W) + ox - 16, int((nx + ny) * _HALF_H) + oy - 32)))
+        surface.blits(draws, doreturn=False)
+
+        seconds = int(self.timer)
+        if self._timer_label is None or self._timer_label[0] != seconds:
+            self._timer_label = (seconds, self.font.render(f"Reach class in {seconds}s", True, COLORS.text_light))
+        surface.blit(self._timer_label[1], (80, 460))
+
+    def _build_floor_surface(self) -> pygame.Surface:
+        """Rasterize the static hallway diamonds once; render just blits."""
+
+        floor = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        origin = self._origin
+        for y in range(_MAP_HEIGHT):
+            for x in range(_MAP_WIDTH):
+                cx = (x - y) * _HALF_W + origin[0]
+                cy = (x + y) * _HALF_H + origin[1]
+                if (x, y) in _WALLS:
                     color = (60, 52, 68)
                 else:
-                    color = COLORS.warm_neutral if y < self._map_height - 1 else COLORS.accent_cool
+                    color = COLORS.warm_neutral if y < _MAP_HEIGHT - 1 else COLORS.accent_cool
                 points = [
-                    (cx, cy - TILE_HEIGHT // 2),
-                    (cx + TILE_WIDTH // 2, cy),
-                    (cx, cy + TILE_HEIGHT // 2),
-                    (cx - TILE_WIDTH // 2, cy)
+                    (cx, cy - _HALF_H),
+                    (cx + _HALF_W, cy),
+                    (cx, cy + _HALF_H),
+                    (cx - _HALF_W, cy)
                 ]
-                pygame.draw.polygon(surface, color, points)
-                pygame.draw.polygon(surface, COLORS.warm_dark, points, 1)
-
-        self._draw_player(origin)
-        for npc in self.npcs:
-            self._draw_npc(origin, npc)
-
-        timer_surface = self.font.render(f"Reach class in {int(self.timer)}s", True, COLORS.text_light)
-        surface.blit(timer_surface, (80, 460))
+                pygame.draw.polygon(floor, color, points)
+                pygame.draw.polygon(floor, COLORS.warm_dark, points, 1)
+        return floor
 
     def _spawn_npcs(self) -> None:
         self.npcs.clear()
@@ -126,21 +175,10 @@ class SchoolScene(Scene):
 
     def _move_player(self, direction: pygame.math.Vector2) -> None:
         target = self.player_pos + direction
-        if 0 <= target.x < self._map_width and 0 <= target.y < self._map_height:
-            if (int(target.x), int(target.y)) not in self._walls:
+        if 0 <= target.x < _MAP_WIDTH and 0 <= target.y < _MAP_HEIGHT:
+            if not (_WALLS_MASK >> (int(target.y) * _MAP_WIDTH + int(target.x))) & 1:
                 self.player_pos = target
 
-    def _draw_player(self, origin: tuple[int, int]) -> None:
-        px = (self.player_pos.x - self.player_pos.y) * TILE_WIDTH // 2 + origin[0]
-        py = (self.player_pos.x + self.player_pos.y) * TILE_HEIGHT // 2 + origin[1] - 18
-        pygame.draw.circle(self.screen, COLORS.accent_ui, (int(px), int(py)), 20)
-
-    def _draw_npc(self, origin: tuple[int, int], npc: NPC) -> None:
-        nx = (npc.grid_pos.x - npc.grid_pos.y) * TILE_WIDTH // 2 + origin[0]
-        ny = (npc.grid_pos.x + npc.grid_pos.y) * TILE_HEIGHT // 2 + origin[1] - 16
-        color = COLORS.accent_fries if npc.annoying else COLORS.warm_dark
-        pygame.draw.circle(self.screen, color, (int(nx), int(ny)), 16)
-
     def _handle_collision(self, npc: NPC) -> None:
         self.npcs.remove(npc)
         self.collisions_today += 1
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING, Callable
 
 import pygame
 
 from game.balance import get_balance_section
 from game.config import COLORS
 from game.scenes.base import Scene
-from game.state import GameState
+from game.state import GameState, TimeSegment
+from game.ui.fonts import get_font
+
+if TYPE_CHECKING:
+    from game.scene_controller import SceneController
 
 DREAMS = [
     "You dream about fries forming a choir, singing in German.",
@@ -22,12 +27,14 @@ class SleepScene(Scene):
     def __init__(self, state: GameState, screen: pygame.Surface) -> None:
         super().__init__(state)
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(None, 36)
         self.timer = 4.5
         self.dream_text = random.choice(DREAMS)
         self.state.flags.seen_dreams.append(self.dream_text)
         self.summary: list[str] = []
         self._sleep_cfg = get_balance_section("sleep")
+        # The sleep screen is static, so it only needs one draw.
+        self._rendered = False
         self._prepare_rest()
 
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -45,6 +52,14 @@ class SleepScene(Scene):
         dream_surface = self.font.render(self.dream_text, True, COLORS.accent_fries)
         surface.blit(text_surface, (surface.get_width() // 2 - text_surface.get_width() // 2, 200))
         surface.blit(dream_surface, (80, 280))
+        self._rendered = True
+
+    def is_dirty(self) -> bool:
+        return not self._rendered
+
+    def transition_plan(self, controller: "SceneController") -> tuple[list[str], TimeSegment, Callable[[], Scene] | None]:
+        # update() already advanced the segment when sleep finished.
+        return self.get_summary(), self.state.segment, None
 
     def _prepare_rest(self) -> None:
         restore = float(self._sleep_cfg.get("base_restore", 30))
@@ -9,14 +9,15 @@ import pygame
 from game.config import COLORS
 from game.scenes.base import Scene
 from game.state import GameState, TimeSegment
+from game.ui.fonts import get_font
 
 
 class TransitionScene(Scene):
     def __init__(self, state: GameState, screen: pygame.Surface, *, summary: List[str], next_segment: TimeSegment, duration: float = 2.5) -> None:
         super().__init__(state)
         self.screen = screen
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 32)
+        self.small_font = get_font(None, 24)
         self.summary = summary or ["Another blur of a segment passes by."]
         self.next_segment = next_segment
         self.duration = duration
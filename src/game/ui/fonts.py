@@ -0,0 +1,23 @@
+"""Process-wide font cache shared by scenes and minigames."""
+
+from __future__ import annotations
+
+import functools
+from typing import Optional
+
+import pygame
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(path: Optional[str], size: int) -> pygame.font.Font:
+    """Return a cached ``pygame.font.Font``.
+
+    Controllers are rebuilt every segment, and each ``pygame.font.Font``
+    call re-parses the font file; caching per (path, size) makes those
+    rebuilds share one instance.
+    """
+
+    return pygame.font.Font(path, size)
+
+
+__all__ = ["get_font"]
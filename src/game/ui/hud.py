@@ -6,6 +6,7 @@ import pygame
 
 from game.config import COLORS
 from game.state import GameState, TimeSegment
+from game.ui.fonts import get_font
 
 
 class StatusBar:
@@ -29,28 +30,48 @@ class StatusBar:
 class HUD:
     def __init__(self, screen: pygame.Surface) -> None:
         self.screen = screen
-        self.font = pygame.font.Font(None, 28)
-        self.big_font = pygame.font.Font(None, 36)
+        self.font = get_font(None, 28)
+        self.big_font = get_font(None, 36)
         self.mood_bar = StatusBar("Mood", COLORS.accent_ui)
         self.hunger_bar = StatusBar("Hunger", COLORS.accent_fries)
         self.energy_bar = StatusBar("Energy", COLORS.accent_cool)
+        # Composed label plaques (translucent box + text) are cached per
+        # value; segment changes four times a day and the day once.
+        self._segment_plaque: tuple[TimeSegment, pygame.Surface] | None = None
+        self._day_plaque: tuple[int, pygame.Surface] | None = None
+        # Snapshot of the values drawn last frame, at the granularity the
+        # HUD actually displays (whole stat points).
+        self._last_drawn: tuple | None = None
+
+    def _snapshot(self, state: GameState) -> tuple:
+        return (int(state.stats.mood), int(state.stats.hunger), int(state.stats.energy), state.segment, state.day)
+
+    def is_dirty(self, state: GameState) -> bool:
+        return self._snapshot(state) != self._last_drawn
+
+    def _compose_plaque(self, text: str, padding: tuple[int, int]) -> pygame.Surface:
+        rendered = self.big_font.render(text, True, COLORS.text_light)
+        pad_x, pad_y = padding
+        plaque = pygame.Surface((rendered.get_width() + pad_x * 2, rendered.get_height() + pad_y * 2), pygame.SRCALPHA)
+        plaque.fill((*COLORS.warm_dark, 200))
+        plaque.blit(rendered, (pad_x, pad_y))
+        return plaque
 
     def render(self, state: GameState) -> None:
         self.mood_bar.render(self.screen, self.font, state.stats.mood, (24, 24))
         self.hunger_bar.render(self.screen, self.font, state.stats.hunger, (24, 64))
         self.energy_bar.render(self.screen, self.font, state.stats.energy, (24, 104))
 
-        segment_text = self.big_font.render(f"{segment_label(state.segment)}", True, COLORS.text_light)
-        day_text = self.big_font.render(f"Day {state.day}", True, COLORS.text_light)
-        segment_bg = pygame.Surface((segment_text.get_width() + 24, segment_text.get_height() + 16), pygame.SRCALPHA)
-        segment_bg.fill((*COLORS.warm_dark, 200))
-        segment_bg.blit(segment_text, (12, 8))
-        self.screen.blit(segment_bg, (self.screen.get_width() // 2 - segment_bg.get_width() // 2, 24))
+        if self._segment_plaque is None or self._segment_plaque[0] != state.segment:
+            self._segment_plaque = (state.segment, self._compose_plaque(segment_label(state.segment), (12, 8)))
+        if self._day_plaque is None or self._day_plaque[0] != state.day:
+            self._day_plaque = (state.day, self._compose_plaque(f"Day {state.day}", (8, 6)))
 
-        day_bg = pygame.Surface((day_text.get_width() + 16, day_text.get_height() + 12), pygame.SRCALPHA)
-        day_bg.fill((*COLORS.warm_dark, 200))
-        day_bg.blit(day_text, (8, 6))
+        segment_bg = self._segment_plaque[1]
+        self.screen.blit(segment_bg, (self.screen.get_width() // 2 - segment_bg.get_width() // 2, 24))
+        day_bg = self._day_plaque[1]
         self.screen.blit(day_bg, (self.screen.get_width() - day_bg.get_width() - 24, 24))
+        self._last_drawn = self._snapshot(state)
 
 
 def segment_label(segment: TimeSegment) -> str: